@@ -5,7 +5,9 @@ import os
 import shutil
 import sys
 import time
+from collections import Counter
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
 
 from .discovery import sync_all_patterns_verbose, load_sync_state, sync_session_resolutions
@@ -934,11 +936,7 @@ def cmd_process_session(args):
             signals = run_checks(paragraphs, checks)
 
             # Create signal summary (for template compatibility)
-            signal_summary = {}
-            if signals:
-                for para_signals in signals.values():
-                    for signal in para_signals:
-                        signal_summary[signal] = signal_summary.get(signal, 0) + 1
+            signal_summary = dict(Counter(chain.from_iterable(signals.values())))
 
             # Classify document
             doc_type = "resolution"  # All session documents are resolutions
@@ -0,0 +1,109 @@
+"""Cached loading of the pipeline's YAML configuration files."""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Parsed configs keyed by path, with the (mtime_ns, size) they were read at
+_CONFIG_CACHE: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+_CONFIG_CACHE_SIZE = 100
+
+# Suffix of the JSON copy written next to each YAML file
+SIDECAR_SUFFIX = ".cache.json"
+
+
+def load_yaml_config(config_path: Path) -> Any:
+    """
+    Load a YAML configuration file, reusing the parse while it is unchanged.
+
+    Results are cached per path and revalidated against the file's
+    modification time and size on every call. Across processes, the parse
+    is shared through a JSON sidecar (``<name>.yaml.cache.json``) that is
+    much faster to read than YAML. Callers get their own deep copy, so
+    mutating the result never leaks into later loads.
+
+    Args:
+        config_path: Path to the YAML configuration file
+
+    Returns:
+        The parsed YAML document
+
+    Raises:
+        FileNotFoundError: If config_path does not exist
+    """
+    key = os.fspath(config_path)
+    try:
+        stat = os.stat(key)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        _CONFIG_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    sidecar_path = key + SIDECAR_SUFFIX
+    config = _read_sidecar(sidecar_path, stat)
+    if config is None:
+        with open(key) as f:
+            config = yaml.safe_load(f)
+        _write_sidecar(sidecar_path, stat, config)
+
+    _CONFIG_CACHE[key] = (stat.st_mtime_ns, stat.st_size, config)
+    _CONFIG_CACHE.move_to_end(key)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+
+    return copy.deepcopy(config)
+
+
+def _read_sidecar(sidecar_path: str, stat: os.stat_result) -> Any:
+    """Return the sidecar's config if it was written from this exact file."""
+    try:
+        with open(sidecar_path, encoding="utf-8") as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(sidecar, dict):
+        return None
+    if sidecar.get("mtime_ns") != stat.st_mtime_ns or sidecar.get("size") != stat.st_size:
+        return None
+    return sidecar.get("config")
+
+
+def _write_sidecar(sidecar_path: str, stat: os.stat_result, config: Any) -> None:
+    """Store config as JSON, skipping documents JSON cannot represent exactly."""
+    try:
+        encoded = json.dumps(
+            {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "config": config},
+            ensure_ascii=False,
+        )
+    except (TypeError, ValueError):
+        return
+    # e.g. integer mapping keys would come back as strings
+    if json.loads(encoded)["config"] != config:
+        return
+
+    # Write atomically so concurrent loaders never read a partial file
+    tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(encoded)
+        os.replace(tmp_path, sidecar_path)
+    except OSError as e:
+        logger.debug("Could not write config cache %s: %s", sidecar_path, e)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
@@ -1,8 +1,17 @@
 """Check system for detecting signals in UN resolution paragraphs."""
 
+import re
+import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
+from .config import load_yaml_config
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional speedup
+    hyperscan = None
 
 
 def load_checks(config_path: Path) -> list[dict]:
@@ -17,21 +26,87 @@ def load_checks(config_path: Path) -> list[dict]:
         - signal: Signal name (used for display and matching)
         - phrases: List of phrases to search for
     """
-    config_path = Path(config_path)
+    config = load_yaml_config(Path(config_path))
+    return config.get("checks", [])
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+def build_check_db(checks: list[dict]):
+    """
+    Compile every check phrase into a single Hyperscan database.
 
-    return config.get("checks", [])
+    Each phrase is matched as a literal against lowercased UTF-8 text and
+    reports the index of its check, so one scan per paragraph finds all
+    matching checks.
+
+    Args:
+        checks: List of check definitions from load_checks()
+
+    Returns:
+        Tuple of (database, indices of checks that match every paragraph),
+        or None when Hyperscan is not installed. The database is None if no
+        check has a non-empty phrase.
+    """
+    if hyperscan is None:
+        return None
+
+    expressions = []
+    ids = []
+    always = set()
+    for check_idx, check in enumerate(checks):
+        for phrase in check.get("phrases", []):
+            phrase = phrase.lower()
+            if not phrase:
+                # "" is a substring of every paragraph
+                always.add(check_idx)
+                continue
+            expressions.append(re.escape(phrase).encode("utf-8"))
+            ids.append(check_idx)
+
+    if not expressions:
+        return None, frozenset(always)
+
+    db = hyperscan.Database()
+    db.compile(
+        expressions=expressions,
+        ids=ids,
+        elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8] * len(expressions),
+    )
+    return db, frozenset(always)
+
+
+@lru_cache(maxsize=16)
+def _cached_check_db(checks_key: tuple[tuple[str, ...], ...]):
+    """
+    Compile a database for checks identified by their phrase tuples.
+
+    Returns the build_check_db() result plus a thread-local holder for the
+    database's scratch space, since one scratch cannot serve concurrent scans.
+    """
+    db, always = build_check_db([{"phrases": list(phrases)} for phrases in checks_key])
+    return db, always, threading.local()
+
+
+def _thread_scratch(db, scratch_local: threading.local):
+    """Return this thread's scratch space for db, allocating it on first use."""
+    scratch = getattr(scratch_local, "scratch", None)
+    if scratch is None:
+        scratch = scratch_local.scratch = hyperscan.Scratch(db)
+    return scratch
+
+
+def _intern_signal(signal):
+    """Intern a signal name if it is a string."""
+    return sys.intern(signal) if isinstance(signal, str) else signal
 
 
 def run_checks(paragraphs: dict[int, str], checks: list[dict]) -> dict[int, list[str]]:
     """
     Run checks against operative paragraphs and find matching signals.
 
+    Uses a compiled Hyperscan database when the hyperscan package is
+    installed, and a per-phrase substring scan otherwise.
+
     Args:
         paragraphs: Dictionary mapping paragraph numbers to text
         checks: List of check definitions from load_checks()
@@ -39,15 +114,37 @@ def run_checks(paragraphs: dict[int, str], checks: list[dict]) -> dict[int, list
     Returns:
         Dictionary mapping paragraph numbers to lists of matched signals
     """
+    # Signal names repeat across every paragraph of every document; interning
+    # makes all occurrences share one string. YAML may yield non-str names
+    # (e.g. ``signal: 2030``), which are passed through unchanged.
+    signals = [_intern_signal(check.get("signal", "unknown")) for check in checks]
+
+    if hyperscan is not None and paragraphs:
+        checks_key = tuple(tuple(check.get("phrases", [])) for check in checks)
+        db, always, scratch_local = _cached_check_db(checks_key)
+        scratch = _thread_scratch(db, scratch_local) if db is not None else None
+
+        results = {}
+        for para_num, para_text in paragraphs.items():
+            matched = set(always)
+            if db is not None:
+                db.scan(
+                    para_text.lower().encode("utf-8"),
+                    match_event_handler=lambda check_idx, start, end, flags, context: matched.add(check_idx),
+                    scratch=scratch,
+                )
+            if matched:
+                results[para_num] = [signals[check_idx] for check_idx in sorted(matched)]
+        return results
+
     results = {}
 
     for para_num, para_text in paragraphs.items():
         para_lower = para_text.lower()
         matched_signals = []
 
-        for check in checks:
+        for check, signal in zip(checks, signals):
             phrases = check.get("phrases", [])
-            signal = check.get("signal", "unknown")
 
             for phrase in phrases:
                 if phrase.lower() in para_lower:
@@ -6,8 +6,8 @@ from pathlib import Path
 from typing import Iterator
 
 import requests
-import yaml
 
+from .config import load_yaml_config
 from .downloader import download_document, file_exists_for_symbol
 
 
@@ -21,14 +21,7 @@ def load_patterns(config_path: Path) -> list[dict]:
     Returns:
         List of pattern definitions
     """
-    config_path = Path(config_path)
-
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
-
+    config = load_yaml_config(Path(config_path))
     return config.get("patterns", [])
 
 
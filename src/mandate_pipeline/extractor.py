@@ -1,6 +1,7 @@
 """Extract text from PDF documents."""
 
 import re
+import sys
 from pathlib import Path
 
 import pymupdf
@@ -90,6 +91,9 @@ _PAGE_HEADER_RE = re.compile(
 # Matches footnote blocks at end of text (no continuation after)
 _FOOTNOTE_TAIL_RE = re.compile(r"\s*_{3,}\s*.+$")
 
+# Matches draft (L.) symbols, e.g. "A/80/L.1" or "A/C.3/80/L.12"
+_SYMBOL_RE = re.compile(r"\bA(?:/[A-Z0-9.]+)+/L\.\d+\b", re.IGNORECASE)
+
 
 def _clean_paragraph_text(text: str) -> str:
     """Remove PDF extraction artifacts from paragraph text.
@@ -473,7 +477,7 @@ def extract_agenda_items(text: str) -> list[str]:
     Returns:
         List of agenda item strings, e.g., ["Item 68", "Item 12A"]
     """
-    items = []
+    items = {}
     patterns = [
         r"\bAgenda item[s]?\s+(\d+[A-Za-z]?)\b",
         r"\bItem\s+(\d+[A-Za-z]?)\b",
@@ -481,11 +485,9 @@ def extract_agenda_items(text: str) -> list[str]:
 
     for pattern in patterns:
         for match in re.finditer(pattern, text, re.IGNORECASE):
-            item = f"Item {match.group(1)}"
-            if item not in items:
-                items.append(item)
+            items.setdefault(f"Item {match.group(1)}")
 
-    return items
+    return list(items)
 
 
 def find_symbol_references(text: str) -> list[str]:
@@ -498,11 +500,7 @@ def find_symbol_references(text: str) -> list[str]:
     Returns:
         List of referenced symbols (unique, in appearance order)
     """
-    pattern = r"\bA(?:/[A-Z0-9.]+)+/L\.\d+\b"
-    matches = re.finditer(pattern, text, re.IGNORECASE)
-    symbols = []
-    for match in matches:
-        symbol = match.group(0).upper()
-        if symbol not in symbols:
-            symbols.append(symbol)
-    return symbols
+    matches = _SYMBOL_RE.finditer(text)
+    # dict keeps first-appearance order with O(1) duplicate checks
+    symbols = dict.fromkeys(sys.intern(match.group(0).upper()) for match in matches)
+    return list(symbols)
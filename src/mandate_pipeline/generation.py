@@ -4,8 +4,12 @@ import json
 import logging
 import os
 import re
+import sys
 import time
+from collections import Counter
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +19,12 @@ from jinja2 import Environment, FileSystemLoader
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _to_int(value) -> int:
+    """int() for paragraph numbers, memoized because the same few values recur."""
+    return int(value)
+
+
 def safe_paragraph_number(para: dict, default: int = 0) -> int:
     """
     Safely extract and convert paragraph number to int for sorting.
@@ -27,8 +37,7 @@ def safe_paragraph_number(para: dict, default: int = 0) -> int:
         Integer paragraph number, or default if conversion fails
     """
     try:
-        num = para.get("number", default)
-        return int(num)
+        return _to_int(para.get("number", default))
     except (TypeError, ValueError) as e:
         logger.warning(f"Invalid paragraph number '{para.get('number')}': {e}")
         return default
@@ -95,7 +104,8 @@ def filename_to_symbol(filename: str) -> str:
     # First, replace all underscores
     symbol = stem.replace("_", "/")
     
-    return symbol
+    # Interned: the symbol is reused as a key throughout linking
+    return sys.intern(symbol)
 
 
 def derive_session_from_symbol(symbol: str) -> str | None:
@@ -187,10 +197,7 @@ def load_all_documents(data_dir: Path, checks: list) -> list[dict]:
             signals = run_checks(paragraphs, checks) if checks else {}
 
             # Build signal summary
-            signal_summary = {}
-            for para_signals in signals.values():
-                for sig in para_signals:
-                    signal_summary[sig] = signal_summary.get(sig, 0) + 1
+            signal_summary = dict(Counter(chain.from_iterable(signals.values())))
 
             documents.append({
                 "symbol": symbol,
@@ -238,10 +245,9 @@ def generate_data_json(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Calculate aggregate stats
-    total_signal_counts = {}
+    total_signal_counts = Counter()
     for doc in documents:
-        for sig, count in doc.get("signal_summary", {}).items():
-            total_signal_counts[sig] = total_signal_counts.get(sig, 0) + count
+        total_signal_counts.update(doc.get("signal_summary", {}))
 
     data = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -250,7 +256,7 @@ def generate_data_json(
         "stats": {
             "total_documents": len(documents),
             "documents_with_signals": len([d for d in documents if d.get("signals")]),
-            "signal_counts": total_signal_counts,
+            "signal_counts": dict(total_signal_counts),
         },
     }
 
@@ -521,7 +527,7 @@ def build_igov_decision_documents(decisions: list[dict], checks: list) -> list[d
         paragraphs = {1: decision_text} if decision_text else {}
         signals = run_checks(paragraphs, checks) if checks and paragraphs else {}
 
-        signal_summary = {}
+        signal_summary = Counter()
         signal_paragraphs = []
         for para_num, para_signals in signals.items():
             if not para_signals:
@@ -531,8 +537,7 @@ def build_igov_decision_documents(decisions: list[dict], checks: list) -> list[d
                 "text": paragraphs.get(para_num, ""),
                 "signals": para_signals,
             })
-            for sig in para_signals:
-                signal_summary[sig] = signal_summary.get(sig, 0) + 1
+            signal_summary.update(para_signals)
 
         decision_number = str(decision.get("decision_number") or "").strip()
         session = decision.get("session")
@@ -559,7 +564,7 @@ def build_igov_decision_documents(decisions: list[dict], checks: list) -> list[d
             "origin": "IGov",
             "paragraphs": paragraphs,
             "signals": signals,
-            "signal_summary": signal_summary,
+            "signal_summary": dict(signal_summary),
             "signal_paragraphs": signal_paragraphs,
         })
 
@@ -785,10 +790,7 @@ def generate_site_verbose(
             signals = run_checks(paragraphs, checks) if checks else {}
 
             # Build signal summary
-            signal_summary = {}
-            for para_signals in signals.values():
-                for sig in para_signals:
-                    signal_summary[sig] = signal_summary.get(sig, 0) + 1
+            signal_summary = dict(Counter(chain.from_iterable(signals.values())))
 
             doc = {
                 "symbol": symbol,
@@ -875,17 +877,16 @@ def generate_site_verbose(
         on_generate_end(generate_duration)
 
     # Calculate stats
-    total_signal_counts = {}
+    total_signal_counts = Counter()
     for doc in visible_documents:
-        for sig, count in doc.get("signal_summary", {}).items():
-            total_signal_counts[sig] = total_signal_counts.get(sig, 0) + count
+        total_signal_counts.update(doc.get("signal_summary", {}))
 
     return {
         "total_documents": len(browser_documents),
         "documents_with_signals": len([d for d in browser_documents if d.get("signals")]),
         "document_pages": len(documents),
         "signal_pages": len(checks),
-        "signal_counts": total_signal_counts,
+        "signal_counts": dict(total_signal_counts),
     }
 
 
@@ -3,27 +3,74 @@
 from __future__ import annotations
 
 import hashlib
+import importlib.util
 import json
 import logging
 import os
 import re
+import sys
+import threading
 import time
+import unicodedata
 import xml.etree.ElementTree as ET
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Sequence
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - optional speedup
+    fuzz = process = None
+
+# RapidFuzz's cpdist returns a NumPy array, but RapidFuzz does not require
+# NumPy; it is installed with the jit extra
+_HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # UN Digital Library API for MARC XML metadata
 UNDL_SEARCH_URL = "https://digitallibrary.un.org/search"
-UNDL_TIMEOUT = 30  # seconds
+UNDL_TIMEOUT = (3.05, 30)  # (connect, read) seconds
+UNDL_POLITE_DELAY = 3  # minimum seconds between single-symbol fetches
+UNDL_MAX_WORKERS = 4  # concurrent requests in fetch_many_undl_metadata
+# Bulk fetches admit UNDL_RATE_LIMIT requests per UNDL_RATE_WINDOW seconds:
+# the single-fetch pace on average, but with short concurrent bursts
+UNDL_RATE_LIMIT = 4
+UNDL_RATE_WINDOW = UNDL_RATE_LIMIT * UNDL_POLITE_DELAY
+# Transport-level retries; 429 responses carrying Retry-After wait as told.
+# fetch_undl_metadata retries again on top of these, so keep them short.
+UNDL_RETRY_TOTAL = 3
+UNDL_RETRY_BACKOFF = 0.1
+UNDL_HEADERS = {
+    "Accept": "application/marcxml+xml, application/xml;q=0.9, */*;q=0.1",
+    "Accept-Encoding": "gzip, deflate",
+}
 MARC_NS = {"marc": "http://www.loc.gov/MARC21/slim"}
+_MARC_RECORD = "{http://www.loc.gov/MARC21/slim}record"
+_XML_FEED_SIZE = 64 * 1024  # characters fed to the MARC XML parser at a time
+_DRAFT_SYMBOL_RE = re.compile(r"/L\.\d+")
+_EXCLUDED_DRAFT_RE = re.compile(r"/(?:REV|ADD|CORR)\.", re.IGNORECASE)
 UNDL_CACHE_ENV = "MANDATE_UNDL_CACHE_DIR"
 CACHE_DIR = Path(os.getenv(UNDL_CACHE_ENV, "data/cache/undl"))
+UNDL_NOT_FOUND_TTL = 7 * 24 * 60 * 60  # seconds before re-querying unknown symbols
+
+# Minimum title similarity (0-100) for a Pass 2 fuzzy link
+FUZZY_MATCH_THRESHOLD = 85.0
+
+_TITLE_PREFIX_RE = re.compile(r"^\s*\d+/\d+\.\s*")
+_TITLE_STRIP_RE = re.compile(r"[^a-z0-9 ]+")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 # Committee names for display
 COMMITTEE_NAMES = {
@@ -42,15 +89,28 @@ _linking_audit: dict[str, dict[str, Any]] = {}
 
 _SESSION = None
 
+# Shared sliding-window limiter for concurrent UNDL requests
+_rate_lock = threading.Lock()
+_request_times: deque[float] = deque()
+
+# End of the last single-symbol fetch's polite pause (see _polite_pause)
+_polite_lock = threading.Lock()
+_last_request_ts = 0.0
+
+# In-process view of the UNDL cache directory (see _load_cache_index)
+_cache_index: dict[str, Any] = {"dir": None, "names": set(), "entries": {}, "legacy": False}
+_LEGACY_CACHE_NAME_RE = re.compile(r"^[0-9a-f]{32}\.json$")
+
 
 def _get_session() -> requests.Session:
     """Get or create a reusable requests session with retries."""
     global _SESSION
     if _SESSION is None:
         _SESSION = requests.Session()
+        _SESSION.headers.update(UNDL_HEADERS)
         retries = Retry(
-            total=5,
-            backoff_factor=1,
+            total=UNDL_RETRY_TOTAL,
+            backoff_factor=UNDL_RETRY_BACKOFF,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET"],
         )
@@ -65,8 +125,10 @@ def fetch_undl_metadata(symbol: str) -> dict | None:
     Queries the UNDL search API for the given symbol and parses the MARC XML
     response to extract related document symbols from tag 993.
 
-    Includes caching and rate limiting. Cache location can be overridden via
-    the MANDATE_UNDL_CACHE_DIR environment variable.
+    Includes caching and rate limiting. Results persist across runs in the
+    cache directory, which can be overridden via the MANDATE_UNDL_CACHE_DIR
+    environment variable. Symbols UNDL has no record for are re-queried once
+    their cache entry is older than UNDL_NOT_FOUND_TTL.
 
     Args:
         symbol: UN resolution symbol (e.g., "A/RES/80/142")
@@ -80,6 +142,79 @@ def fetch_undl_metadata(symbol: str) -> dict | None:
             "base_proposal": str | None,   # first L. document
         }
     """
+    return _fetch_undl_metadata(symbol)
+
+
+def fetch_many_undl_metadata(
+    symbols: Iterable[str], max_workers: int = UNDL_MAX_WORKERS
+) -> dict[str, dict | None]:
+    """
+    Fetch UNDL metadata for many symbols concurrently.
+
+    Cached symbols are answered directly; the rest are fetched on a thread
+    pool sharing the session's connection pool. Instead of sleeping after
+    every request, workers share a sliding-window limiter that admits at
+    most UNDL_RATE_LIMIT requests per UNDL_RATE_WINDOW seconds, the same
+    average pace as the single-symbol path.
+
+    Args:
+        symbols: UN resolution symbols (duplicates are fetched once)
+        max_workers: Maximum number of concurrent requests
+
+    Returns:
+        Dictionary mapping each symbol to its metadata (see
+        fetch_undl_metadata), or None if the lookup failed
+    """
+    results: dict[str, dict | None] = {}
+    pending = []
+    for symbol in dict.fromkeys(symbols):
+        cached = _get_cached_metadata(symbol)
+        if cached:
+            results[symbol] = cached
+        else:
+            pending.append(symbol)
+
+    if pending:
+        # Create the shared session before the workers race to do so
+        _get_session()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetched = executor.map(partial(_fetch_undl_metadata, rate_limited=True), pending)
+            results.update(zip(pending, fetched))
+
+    return results
+
+
+def _wait_for_rate_limit() -> None:
+    """Block until another UNDL request fits in the shared sliding window."""
+    while True:
+        with _rate_lock:
+            now = time.monotonic()
+            while _request_times and now - _request_times[0] >= UNDL_RATE_WINDOW:
+                _request_times.popleft()
+            if len(_request_times) < UNDL_RATE_LIMIT:
+                _request_times.append(now)
+                return
+            delay = UNDL_RATE_WINDOW - (now - _request_times[0])
+        time.sleep(delay)
+
+
+def _polite_pause() -> None:
+    """Sleep for whatever remains of UNDL_POLITE_DELAY since the last fetch."""
+    global _last_request_ts
+    with _polite_lock:
+        delay = UNDL_POLITE_DELAY - (time.monotonic() - _last_request_ts)
+        if delay > 0:
+            time.sleep(delay)
+        _last_request_ts = time.monotonic()
+
+
+def _fetch_undl_metadata(symbol: str, rate_limited: bool = False) -> dict | None:
+    """
+    Fetch one symbol's UNDL metadata (see fetch_undl_metadata).
+
+    With rate_limited=True, requests are paced by the shared limiter used by
+    fetch_many_undl_metadata instead of the polite pause after each success.
+    """
     # 1. Check cache
     cached = _get_cached_metadata(symbol)
     if cached:
@@ -101,6 +236,8 @@ def fetch_undl_metadata(symbol: str) -> dict | None:
 
     for attempt in range(max_retries):
         try:
+            if rate_limited:
+                _wait_for_rate_limit()
             resp = session.get(UNDL_SEARCH_URL, params=params, timeout=UNDL_TIMEOUT)
 
             # Handle rate limiting specifically
@@ -125,8 +262,10 @@ def fetch_undl_metadata(symbol: str) -> dict | None:
                 result = _build_empty_metadata(symbol)
                 _save_cached_metadata(symbol, result)
 
-            # 4. Be polite with longer delay (increased from 1s to 3s)
-            time.sleep(3)
+            # 4. Be polite: keep successive fetches UNDL_POLITE_DELAY apart,
+            # counting time already spent on this request
+            if not rate_limited:
+                _polite_pause()
 
             return result
 
@@ -143,10 +282,25 @@ def fetch_undl_metadata(symbol: str) -> dict | None:
 
 
 def _get_cache_path(symbol: str) -> Path:
-    """Generate a safe cache file path for a symbol."""
-    # Use MD5 hash to handle special characters and length
+    """Generate a cache file path for a symbol (e.g. A_RES_80_1.json)."""
+    return _cache_path(CACHE_DIR, symbol)
+
+
+def _get_legacy_cache_path(symbol: str) -> Path:
+    """Cache file path used before entries were keyed by filename-safe symbol."""
+    return _legacy_cache_path(CACHE_DIR, symbol)
+
+
+# Keyed on the directory too, so overriding CACHE_DIR never yields stale paths
+@lru_cache(maxsize=4096)
+def _cache_path(cache_dir: Path, symbol: str) -> Path:
+    return cache_dir / f"{symbol_to_filename(symbol)}.json"
+
+
+@lru_cache(maxsize=4096)
+def _legacy_cache_path(cache_dir: Path, symbol: str) -> Path:
     symbol_hash = hashlib.md5(symbol.encode("utf-8")).hexdigest()
-    return CACHE_DIR / f"{symbol_hash}.json"
+    return cache_dir / f"{symbol_hash}.json"
 
 
 def _build_empty_metadata(symbol: str) -> dict:
@@ -160,16 +314,79 @@ def _build_empty_metadata(symbol: str) -> dict:
     }
 
 
+def _load_cache_index() -> dict[str, Any]:
+    """
+    Return the in-process index of CACHE_DIR, scanning the directory once.
+
+    The index holds the cache file names from a single directory scan and the
+    entries parsed so far, so lookups need no per-symbol stat calls and
+    repeated lookups need no file reads. It is rebuilt if CACHE_DIR changes.
+    """
+    if _cache_index["dir"] != CACHE_DIR:
+        try:
+            with os.scandir(CACHE_DIR) as entries:
+                names = {entry.name for entry in entries if entry.name.endswith(".json")}
+        except OSError:
+            names = set()
+        _cache_index.update(
+            dir=CACHE_DIR,
+            names=names,
+            entries={},
+            legacy=any(_LEGACY_CACHE_NAME_RE.match(name) for name in names),
+        )
+    return _cache_index
+
+
 def _get_cached_metadata(symbol: str) -> dict | None:
     """Retrieve metadata from local cache if it exists."""
+    index = _load_cache_index()
+    if symbol in index["entries"]:
+        return index["entries"][symbol]
+
     cache_path = _get_cache_path(symbol)
-    if cache_path.exists():
+    if cache_path.name not in index["names"]:
+        # Adopt entries written under the old hashed naming scheme
+        if not index["legacy"]:
+            return None
+        legacy_path = _get_legacy_cache_path(symbol)
+        if legacy_path.name not in index["names"]:
+            return None
         try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning("Failed to read cache for %s: %s", symbol, e)
-    return None
+            legacy_path.replace(cache_path)
+            index["names"].discard(legacy_path.name)
+            index["names"].add(cache_path.name)
+        except OSError as e:
+            logger.warning("Failed to migrate cache for %s: %s", symbol, e)
+            cache_path = legacy_path
+
+    try:
+        data = _load_json(cache_path)
+        # Records UNDL did not know yet may appear later; re-query them
+        if data.get("not_found") and time.time() - cache_path.stat().st_mtime > UNDL_NOT_FOUND_TTL:
+            return None
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("Failed to read cache for %s: %s", symbol, e)
+        return None
+
+    index["entries"][symbol] = data
+    return data
+
+
+def _load_json(path: Path) -> Any:
+    """Read a JSON cache file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_json(path: Path, data: Any) -> None:
+    """Write a JSON cache file, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
 
 
 def _save_cached_metadata(symbol: str, data: dict) -> None:
@@ -180,48 +397,51 @@ def _save_cached_metadata(symbol: str, data: dict) -> None:
     try:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
         cache_path = _get_cache_path(symbol)
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        _dump_json(cache_path, data)
     except OSError as e:
         logger.warning("Failed to save cache for %s: %s", symbol, e)
+        return
+
+    index = _load_cache_index()
+    index["names"].add(cache_path.name)
+    index["entries"][symbol] = data
 
 
-def _extract_undl_metadata(root: ET.Element, target_symbol: str) -> dict | None:
-    """Extract metadata for a target symbol from a parsed MARC XML root."""
+def _extract_record_metadata(record: ET.Element, target_symbol: str) -> dict | None:
+    """Extract metadata from a MARC record if it describes the target symbol."""
     # Normalize target for comparison
     target_upper = target_symbol.upper()
 
-    for record in root.findall(".//marc:record", MARC_NS):
-        # Check tag 191 subfield 'a' for the document symbol
-        tag_191 = record.find(
-            ".//marc:datafield[@tag='191']/marc:subfield[@code='a']", MARC_NS
-        )
-        if tag_191 is None or not tag_191.text:
-            continue
+    # Single pass over the record's datafields: tag 191 subfield 'a' holds
+    # the document symbol, tag 993 subfields 'a' the cross-references
+    record_symbol = None
+    related_symbols = []
+    for datafield in record.iterfind("marc:datafield", MARC_NS):
+        tag = datafield.get("tag")
+        if tag == "191" and record_symbol is None:
+            subfield = datafield.find("marc:subfield[@code='a']", MARC_NS)
+            if subfield is None:
+                continue
+            record_symbol = (subfield.text or "").strip().upper()
+            if record_symbol != target_upper:
+                return None
+        elif tag == "993":
+            for subfield in datafield.iterfind("marc:subfield[@code='a']", MARC_NS):
+                if subfield.text:
+                    related_symbols.append(subfield.text.strip())
 
-        record_symbol = tag_191.text.strip().upper()
-        if record_symbol != target_upper:
-            continue
+    if record_symbol != target_upper:
+        return None
 
-        # Found matching record - extract tag 993 cross-references
-        related_symbols = []
-        for tag_993 in record.findall(
-            ".//marc:datafield[@tag='993']/marc:subfield[@code='a']", MARC_NS
-        ):
-            if tag_993.text:
-                related_symbols.append(tag_993.text.strip())
-
-        # Filter for L. documents (draft proposals)
-        draft_symbols = [s for s in related_symbols if re.search(r"/L\.\d+", s)]
-
-        return {
-            "symbol": target_symbol,
-            "related_symbols": related_symbols,
-            "draft_symbols": draft_symbols,
-            "base_proposal": draft_symbols[0] if draft_symbols else None,
-        }
+    # Filter for L. documents (draft proposals)
+    draft_symbols = [s for s in related_symbols if _DRAFT_SYMBOL_RE.search(s)]
 
-    return None
+    return {
+        "symbol": target_symbol,
+        "related_symbols": related_symbols,
+        "draft_symbols": draft_symbols,
+        "base_proposal": draft_symbols[0] if draft_symbols else None,
+    }
 
 
 def _parse_undl_marc_xml_with_status(
@@ -230,16 +450,30 @@ def _parse_undl_marc_xml_with_status(
     """
     Parse MARC XML response and extract related symbols.
 
+    The response is parsed incrementally: each record is inspected as soon
+    as it is complete and then cleared, and parsing stops at the matching
+    record instead of building the whole collection tree first.
+
     Returns:
         Tuple of (parsed metadata dict or None, whether XML parsed successfully)
     """
+    parser = ET.XMLPullParser(events=("end",))
     try:
-        root = ET.fromstring(xml_text)
+        for offset in range(0, len(xml_text), _XML_FEED_SIZE):
+            parser.feed(xml_text[offset:offset + _XML_FEED_SIZE])
+            for _, element in parser.read_events():
+                if element.tag != _MARC_RECORD:
+                    continue
+                result = _extract_record_metadata(element, target_symbol)
+                if result:
+                    return result, True
+                element.clear()
+        parser.close()
     except ET.ParseError as e:
         logger.warning("Failed to parse UNDL XML for %s: %s", target_symbol, e)
         return None, False
 
-    return _extract_undl_metadata(root, target_symbol), True
+    return None, True
 
 
 def _parse_undl_marc_xml(xml_text: str, target_symbol: str) -> dict | None:
@@ -257,15 +491,17 @@ def _parse_undl_marc_xml(xml_text: str, target_symbol: str) -> dict | None:
     return result
 
 
+@lru_cache(maxsize=8192)
 def symbol_to_filename(symbol: str) -> str:
     """Convert a UN symbol to a safe filename."""
     return symbol.replace("/", "_")
 
 
+@lru_cache(maxsize=8192)
 def filename_to_symbol(filename: str) -> str:
-    """Convert a filename back to UN symbol."""
+    """Convert a filename back to UN symbol (interned)."""
     stem = filename.replace(".pdf", "")
-    return stem.replace("_", "/")
+    return sys.intern(stem.replace("_", "/"))
 
 
 def classify_symbol(symbol: str) -> str:
@@ -273,19 +509,69 @@ def classify_symbol(symbol: str) -> str:
     upper_symbol = symbol.upper()
     if "/RES/" in upper_symbol:
         return "resolution"
-    if re.search(r"/L\.\d+", upper_symbol):
+    if _DRAFT_SYMBOL_RE.search(upper_symbol):
         return "proposal"
     return "other"
 
 
 def normalize_symbol(symbol: str) -> str:
-    """Normalize a document symbol extracted from text."""
-    return symbol.strip().upper()
+    """Normalize a document symbol extracted from text (interned)."""
+    return sys.intern(symbol.strip().upper())
 
 
 def normalize_title(title: str) -> str:
-    """Normalize a document title for fuzzy matching."""
-    return title.strip().lower()
+    """
+    Normalize a document title for fuzzy matching.
+
+    Strips a leading resolution number (e.g. "80/60. "), folds accents,
+    and reduces the title to lowercase ``[a-z0-9 ]`` with single spaces.
+    """
+    text = title
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = _TITLE_PREFIX_RE.sub("", text.lower())
+    text = _TITLE_STRIP_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _indel_ratio(a: str, b: str) -> float:
+    """Pure-Python equivalent of rapidfuzz.fuzz.ratio (InDel similarity, 0-100)."""
+    total = len(a) + len(b)
+    if total == 0:
+        return 100.0
+    prev = [0] * (len(b) + 1)
+    for ch in a:
+        curr = [0]
+        for j, other in enumerate(b, start=1):
+            if ch == other:
+                curr.append(prev[j - 1] + 1)
+            else:
+                curr.append(max(prev[j], curr[j - 1]))
+        prev = curr
+    return 200.0 * prev[-1] / total
+
+
+def _title_pair_scores(queries: list[str], titles: list[str]) -> Sequence[float]:
+    """
+    Score each query title against the candidate title at the same index.
+
+    Returns 0-100 InDel similarities. Uses RapidFuzz's multithreaded cpdist
+    when NumPy is also installed, then RapidFuzz pair by pair, then the Numba
+    kernel, then pure Python; all backends agree with rapidfuzz.fuzz.ratio.
+    """
+    if process is not None and _HAS_NUMPY:
+        return process.cpdist(queries, titles, scorer=fuzz.ratio, workers=-1)
+    if fuzz is not None:
+        return [fuzz.ratio(query, title) for query, title in zip(queries, titles)]
+
+    # Imported here so loading this module never pays for importing Numba
+    try:
+        from . import linking_numba
+    except ImportError:  # pragma: no cover - optional speedup
+        linking_numba = None
+    if linking_numba is not None:
+        return linking_numba.score_pairs(queries, titles)
+    return [_indel_ratio(query, title) for query, title in zip(queries, titles)]
 
 
 def is_resolution(symbol: str) -> bool:
@@ -298,10 +584,10 @@ def is_proposal(symbol: str) -> bool:
     return "/L." in symbol
 
 
+@lru_cache(maxsize=8192)
 def is_excluded_draft_symbol(symbol: str) -> bool:
     """Return True if symbol is a revision/addendum/corrigendum draft."""
-    upper_symbol = symbol.upper()
-    return any(token in upper_symbol for token in ("/REV.", "/ADD.", "/CORR."))
+    return _EXCLUDED_DRAFT_RE.search(symbol) is not None
 
 
 def is_base_proposal_doc(doc: dict) -> bool:
@@ -389,8 +675,7 @@ def get_undl_cache_stats() -> dict[str, Any]:
         try:
             stat = cache_file.stat()
             total_size += stat.st_size
-            with open(cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json(cache_file)
             entries.append({
                 "symbol": data.get("symbol", "Unknown"),
                 "file": cache_file.name,
@@ -409,6 +694,37 @@ def get_undl_cache_stats() -> dict[str, Any]:
     }
 
 
+def _init_link_fields(documents: list[dict]) -> None:
+    """Ensure every document carries the intermediate linkage fields."""
+    for doc in documents:
+        doc.setdefault("linked_resolution_symbol", None)
+        doc.setdefault("linked_proposal_symbols", [])
+
+
+def _agenda_mask(agenda_items: list[str] | None, agenda_bits: dict[str, int]) -> int:
+    """Encode agenda items as a bitmask, assigning new bits from agenda_bits."""
+    mask = 0
+    for item in agenda_items or ():
+        bit = agenda_bits.get(item)
+        if bit is None:
+            bit = agenda_bits[item] = 1 << len(agenda_bits)
+        mask |= bit
+    return mask
+
+
+def _intern_symbols(documents: list[dict]) -> None:
+    """
+    Intern symbol and agenda strings so the linking dicts and sets compare
+    repeated values by identity and reuse their cached hashes.
+    """
+    for doc in documents:
+        doc["symbol"] = sys.intern(doc["symbol"])
+        for key in ("symbol_references", "linked_proposal_symbols", "agenda_items"):
+            values = doc.get(key)
+            if values:
+                doc[key] = [sys.intern(value) for value in values]
+
+
 def link_documents(documents: list[dict], use_undl_metadata: bool = True) -> None:
     """
     Link resolutions to proposals using explicit references and fuzzy matching.
@@ -424,14 +740,17 @@ def link_documents(documents: list[dict], use_undl_metadata: bool = True) -> Non
     """
     global _linking_audit
     clear_linking_audit()
+    _init_link_fields(documents)
+
+    # Only resolutions initiate links; nothing to do for proposal-only batches
+    if not any(is_resolution(doc["symbol"]) for doc in documents):
+        return
+
+    _intern_symbols(documents)
 
     proposals_by_symbol = {doc["symbol"]: doc for doc in documents if is_proposal(doc["symbol"])}
     proposals = list(proposals_by_symbol.values())
 
-    for doc in documents:
-        doc.setdefault("linked_resolution_symbol", None)
-        doc.setdefault("linked_proposal_symbols", [])
-
     # Initialize audit entries for all resolutions
     for doc in documents:
         if is_resolution(doc["symbol"]):
@@ -455,26 +774,27 @@ def link_documents(documents: list[dict], use_undl_metadata: bool = True) -> Non
 
     # Pass 0: UN Digital Library metadata lookup (authoritative source)
     if use_undl_metadata:
-        for doc in documents:
-            if not is_resolution(doc["symbol"]):
-                continue
-            # Skip if already linked
-            if doc.get("linked_proposal_symbols"):
-                continue
+        # Skip resolutions that are already linked
+        undl_resolutions = [
+            doc for doc in documents
+            if is_resolution(doc["symbol"]) and not doc.get("linked_proposal_symbols")
+        ]
+        undl_metadata = fetch_many_undl_metadata(doc["symbol"] for doc in undl_resolutions)
 
+        for doc in undl_resolutions:
             audit = _linking_audit[doc["symbol"]]
             audit["pass0_undl"]["attempted"] = True
 
-            metadata = fetch_undl_metadata(doc["symbol"])
+            metadata = undl_metadata.get(doc["symbol"])
             if metadata is None or not metadata.get("draft_symbols"):
                 continue
 
-            draft_symbols = metadata["draft_symbols"]
+            draft_symbols = [sys.intern(s) for s in metadata["draft_symbols"]]
             audit["pass0_undl"]["refs"] = draft_symbols
             audit["pass0_undl"]["found"] = True
 
             # Filter to only include proposals we have locally
-            linked = [s for s in draft_symbols if s in proposals_by_symbol]
+            linked = list(dict.fromkeys(s for s in draft_symbols if s in proposals_by_symbol))
             audit["pass0_undl"]["linked"] = linked
 
             if linked:
@@ -504,7 +824,7 @@ def link_documents(documents: list[dict], use_undl_metadata: bool = True) -> Non
             continue
 
         audit["pass1_symbol_refs"]["attempted"] = True
-        linked = [ref for ref in proposal_refs if ref in proposals_by_symbol]
+        linked = list(dict.fromkeys(ref for ref in proposal_refs if ref in proposals_by_symbol))
         audit["pass1_symbol_refs"]["linked"] = linked
 
         if not linked:
@@ -522,36 +842,117 @@ def link_documents(documents: list[dict], use_undl_metadata: bool = True) -> Non
             if proposal.get("linked_resolution_symbol") is None:
                 proposal["linked_resolution_symbol"] = doc["symbol"]
 
+    # Pass 2: Fuzzy title matching, gated by agenda item overlap
+    fuzzy_pool = [p for p in proposals if not is_excluded_draft_symbol(p["symbol"])]
+    pool_titles = [normalize_title(p.get("title", "")) for p in fuzzy_pool]
+    fuzzy_resolutions = [
+        doc for doc in documents
+        if is_resolution(doc["symbol"])
+        and not doc.get("linked_proposal_symbols")
+        and _linking_audit[doc["symbol"]]["pass2_fuzzy"]["resolution_title"]
+    ]
+    if not fuzzy_pool or not fuzzy_resolutions:
+        return
 
+    # Encode agenda items as bitmasks over a shared vocabulary; 0 means
+    # "no agenda items known"
+    agenda_bits: dict[str, int] = {}
+    pool_agenda = [_agenda_mask(p.get("agenda_items"), agenda_bits) for p in fuzzy_pool]
+
+    # Block candidates by agenda item: a resolution is only scored against
+    # proposals sharing one of its agenda items, plus proposals without any.
+    # Agenda items only gate the match when both sides have them.
+    titled_pool = [i for i, title in enumerate(pool_titles) if title]
+    agenda_index: dict[int, list[int]] = defaultdict(list)
+    unscoped_pool = []
+    for i in titled_pool:
+        mask = pool_agenda[i]
+        if not mask:
+            unscoped_pool.append(i)
+        while mask:
+            bit = mask & -mask
+            agenda_index[bit].append(i)
+            mask ^= bit
+
+    resolution_agenda = []
+    blocks = []
+    for doc in fuzzy_resolutions:
+        mask = _agenda_mask(doc.get("agenda_items"), agenda_bits)
+        resolution_agenda.append(mask)
+        if not mask:
+            blocks.append(titled_pool)
+            continue
+        block = set(unscoped_pool)
+        while mask:
+            bit = mask & -mask
+            block.update(agenda_index.get(bit, ()))
+            mask ^= bit
+        blocks.append(sorted(block))
+
+    # Score every blocked pair in one batched call; linking below stays
+    # sequential because each link removes a proposal from later candidates
+    pair_queries = []
+    pair_titles = []
+    for doc, block in zip(fuzzy_resolutions, blocks):
+        pair_queries.extend([_linking_audit[doc["symbol"]]["pass2_fuzzy"]["resolution_title"]] * len(block))
+        pair_titles.extend(pool_titles[i] for i in block)
+    pair_scores = _title_pair_scores(pair_queries, pair_titles) if pair_queries else []
+
+    offset = 0
+    for doc, block, agenda in zip(fuzzy_resolutions, blocks, resolution_agenda):
+        scores = dict(zip(block, pair_scores[offset:offset + len(block)]))
+        offset += len(block)
 
-def annotate_linkage(documents: list[dict]) -> None:
-    """Annotate documents with adopted draft status and linked proposals."""
-    base_proposals = {doc["symbol"]: doc for doc in documents if is_base_proposal_doc(doc)}
+        audit = _linking_audit[doc["symbol"]]
+        fuzzy_audit = audit["pass2_fuzzy"]
+        fuzzy_audit["attempted"] = True
 
-    for doc in documents:
-        doc["is_adopted_draft"] = False
-        doc["adopted_by"] = None
-        doc["linked_proposals"] = []
+        candidates = [i for i in block if fuzzy_pool[i].get("linked_resolution_symbol") is None]
+        if not candidates:
+            continue
 
-    for proposal in base_proposals.values():
-        linked_resolution = proposal.get("linked_resolution_symbol")
-        if linked_resolution:
-            proposal["is_adopted_draft"] = True
-            proposal["adopted_by"] = linked_resolution
+        fuzzy_audit["candidates"] = [
+            {"symbol": fuzzy_pool[i]["symbol"], "score": round(float(scores[i]), 1)}
+            for i in candidates
+        ]
 
-    for doc in documents:
-        if not is_resolution(doc.get("symbol", "")):
+        best_index = max(candidates, key=scores.__getitem__)
+        best = fuzzy_pool[best_index]
+        best_score = float(scores[best_index])
+        fuzzy_audit["best_match"] = best["symbol"]
+        fuzzy_audit["best_score"] = best_score
+        fuzzy_audit["agenda_overlap"] = bool(agenda & pool_agenda[best_index])
+
+        if best_score < FUZZY_MATCH_THRESHOLD:
             continue
-        linked = [
-            symbol for symbol in doc.get("linked_proposal_symbols", [])
-            if symbol in base_proposals
-        ]
-        doc["linked_proposals"] = [
-            {"symbol": symbol, "filename": symbol_to_filename(symbol) + ".html"}
-            for symbol in linked
-        ]
 
-    # Clean up intermediate fields
+        doc["linked_proposal_symbols"] = [best["symbol"]]
+        best["linked_resolution_symbol"] = doc["symbol"]
+        audit["final_method"] = "fuzzy"
+        audit["final_linked"] = [best["symbol"]]
+        audit["confidence"] = round(best_score)
+
+
+def annotate_linkage(documents: list[dict]) -> None:
+    """Annotate documents with adopted draft status and linked proposals."""
+    # Pass 1: index base proposals and write every annotation field once.
+    # Each proposal gets one linked_proposals entry, shared by every
+    # resolution that links to it.
+    proposal_info: dict[str, dict[str, str]] = {}
+    for doc in documents:
+        adopted_by = None
+        if is_base_proposal_doc(doc):
+            symbol = doc["symbol"]
+            proposal_info[symbol] = {"symbol": symbol, "filename": symbol_to_filename(symbol) + ".html"}
+            adopted_by = doc.get("linked_resolution_symbol") or None
+        doc["is_adopted_draft"] = adopted_by is not None
+        doc["adopted_by"] = adopted_by
+        doc["linked_proposals"] = []
+
+    # Pass 2: resolve linked proposals and clean up intermediate fields
     for doc in documents:
         doc.pop("linked_resolution_symbol", None)
-        doc.pop("linked_proposal_symbols", None)
+        linked = doc.pop("linked_proposal_symbols", None)
+        if not linked or not is_resolution(doc.get("symbol", "")):
+            continue
+        doc["linked_proposals"] = [proposal_info[symbol] for symbol in linked if symbol in proposal_info]
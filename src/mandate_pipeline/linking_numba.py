@@ -0,0 +1,76 @@
+"""Numba-compiled fuzzy title scoring for deployments without RapidFuzz.
+
+Titles are compared after normalize_title(), which reduces them to
+``[a-z0-9 ]``, so every title can be handled as a plain ``uint8`` array.
+Importing this module requires ``numba`` and ``numpy``; linking.py falls back
+to pure Python when either is missing.
+"""
+
+from __future__ import annotations
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True)
+def levenshtein_ratio(a, b):
+    """
+    Return the 0-100 similarity of two ASCII byte arrays.
+
+    Uses the InDel distance (substitutions cost 2), the same measure as
+    rapidfuzz.fuzz.ratio and Levenshtein.ratio, so thresholds are
+    interchangeable between backends.
+    """
+    n = a.shape[0]
+    m = b.shape[0]
+    total = n + m
+    if total == 0:
+        return np.float32(100.0)
+
+    # Two-row LCS table; ratio = 2 * LCS / (len(a) + len(b))
+    prev = np.zeros(m + 1, dtype=np.int32)
+    curr = np.zeros(m + 1, dtype=np.int32)
+    for i in range(n):
+        ai = a[i]
+        for j in range(1, m + 1):
+            if ai == b[j - 1]:
+                curr[j] = prev[j - 1] + 1
+            elif prev[j] >= curr[j - 1]:
+                curr[j] = prev[j]
+            else:
+                curr[j] = curr[j - 1]
+        prev, curr = curr, prev
+
+    return np.float32(200.0 * prev[m] / total)
+
+
+@numba.njit(parallel=True, cache=True)
+def _score_pairs(query_buffer, query_offsets, buffer, offsets):
+    n_pairs = query_offsets.shape[0] - 1
+    scores = np.empty(n_pairs, dtype=np.float32)
+    for k in numba.prange(n_pairs):
+        scores[k] = levenshtein_ratio(
+            query_buffer[query_offsets[k]:query_offsets[k + 1]],
+            buffer[offsets[k]:offsets[k + 1]],
+        )
+    return scores
+
+
+def encode_titles(titles: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pack normalized titles into one contiguous buffer.
+
+    Returns:
+        Tuple of (uint8 buffer, int64 offsets) where title i occupies
+        ``buffer[offsets[i]:offsets[i + 1]]``.
+    """
+    encoded = [title.encode("ascii") for title in titles]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(e) for e in encoded])
+    buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return buffer, offsets
+
+
+def score_pairs(queries: list[str], titles: list[str]) -> np.ndarray:
+    """Score each normalized query title against the title at the same index."""
+    return _score_pairs(*encode_titles(queries), *encode_titles(titles))
@@ -0,0 +1,61 @@
+# Shared fixtures for Mandate Pipeline tests
+
+import os
+import types
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def undl_cache_dir(tmp_path, monkeypatch):
+    """Point the UNDL metadata cache at a per-test directory."""
+    cache_dir = tmp_path / "undl_cache"
+    monkeypatch.setattr("mandate_pipeline.linking.CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def undl_ok(monkeypatch):
+    """
+    Serve a canned 200 UNDL response without network access or polite delays.
+
+    Returns a factory that takes the MARC XML body and returns the response.
+    """
+    def _make(xml: str):
+        response = types.SimpleNamespace(
+            status_code=200,
+            text=xml,
+            content=xml.encode("utf-8"),
+            raise_for_status=lambda: None,
+        )
+        session = types.SimpleNamespace(get=lambda *args, **kwargs: response)
+        monkeypatch.setattr("mandate_pipeline.linking._get_session", lambda: session)
+        monkeypatch.setattr("mandate_pipeline.linking.time.sleep", lambda seconds: None)
+        return response
+
+    return _make
+
+
+LINKED_DIR = Path("data/linked")
+
+
+@lru_cache(maxsize=None)
+def list_linked_files() -> tuple[Path, ...]:
+    """Linked document paths under data/linked, listed once per session."""
+    if not LINKED_DIR.exists():
+        return ()
+    # scandir reads names straight from the directory, without stat per entry
+    with os.scandir(LINKED_DIR) as entries:
+        return tuple(sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".json") and entry.name != "index.json"
+        ))
+
+
+def pytest_generate_tests(metafunc):
+    """Run tests taking `linked_file` once per linked document."""
+    if "linked_file" in metafunc.fixturenames:
+        metafunc.parametrize("linked_file", list_linked_files(), ids=lambda path: path.name)
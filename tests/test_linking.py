@@ -16,6 +16,10 @@ from mandate_pipeline.linking import (
     is_excluded_draft_symbol,
     is_base_proposal_doc,
     link_documents,
+    get_linking_audit,
+    _indel_ratio,
+    _title_pair_scores,
+    FUZZY_MATCH_THRESHOLD,
     annotate_linkage,
     fetch_undl_metadata,
     _parse_undl_marc_xml,
@@ -152,17 +156,9 @@ def mock_session(mocker):
 class TestFetchUndlMetadata:
     """Tests for UN Digital Library API fetching."""
 
-    def test_fetch_success(self, mocker, mock_session):
+    def test_fetch_success(self, undl_ok):
         """Fetch metadata successfully from UNDL."""
-        mock_response = mocker.Mock()
-        mock_response.status_code = 200
-        mock_response.text = SAMPLE_MARC_XML
-        mock_response.raise_for_status = mocker.Mock()
-
-        mock_session.get.return_value = mock_response
-
-        mocker.patch("mandate_pipeline.linking.time.sleep")
-        mocker.patch("mandate_pipeline.linking._save_cached_metadata")
+        undl_ok(SAMPLE_MARC_XML)
 
         result = fetch_undl_metadata("A/RES/80/142")
 
@@ -175,6 +171,7 @@ class TestFetchUndlMetadata:
 
         mock_session.get.side_effect = requests.RequestException("Connection failed")
         mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
+        mocker.patch("mandate_pipeline.linking.time.sleep")
 
         result = fetch_undl_metadata("A/RES/80/142")
 
@@ -189,6 +186,7 @@ class TestFetchUndlMetadata:
 
         mock_session.get.return_value = mock_response
         mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
+        mocker.patch("mandate_pipeline.linking.time.sleep")
 
         result = fetch_undl_metadata("A/RES/80/142")
 
@@ -200,20 +198,15 @@ class TestFetchUndlMetadata:
 
         mock_session.get.side_effect = requests.Timeout("Request timed out")
         mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
+        mocker.patch("mandate_pipeline.linking.time.sleep")
 
         result = fetch_undl_metadata("A/RES/80/142")
 
         assert result is None
 
-    def test_fetch_symbol_not_found_cached(self, mocker, mock_session):
+    def test_fetch_symbol_not_found_cached(self, mocker, undl_ok):
         """Cache empty metadata when the symbol is missing from a valid response."""
-        mock_response = mocker.Mock()
-        mock_response.status_code = 200
-        mock_response.text = SAMPLE_MARC_XML
-        mock_response.raise_for_status = mocker.Mock()
-
-        mock_session.get.return_value = mock_response
-        mocker.patch("mandate_pipeline.linking.time.sleep")
+        undl_ok(SAMPLE_MARC_XML)
         save_cache = mocker.patch("mandate_pipeline.linking._save_cached_metadata")
         mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
 
@@ -229,16 +222,9 @@ class TestFetchUndlMetadata:
 class TestLinkDocumentsWithUndl:
     """Tests for link_documents with UNDL metadata integration."""
 
-    def test_link_via_undl_metadata(self, mocker, mock_session):
+    def test_link_via_undl_metadata(self, undl_ok):
         """Link resolution to proposal via UNDL metadata (Pass 0)."""
-        mock_response = mocker.Mock()
-        mock_response.status_code = 200
-        mock_response.text = SAMPLE_MARC_XML
-        mock_response.raise_for_status = mocker.Mock()
-
-        mock_session.get.return_value = mock_response
-        mocker.patch("mandate_pipeline.linking.time.sleep")
-        mocker.patch("mandate_pipeline.linking._save_cached_metadata")
+        undl_ok(SAMPLE_MARC_XML)
 
         documents = [
             {"symbol": "A/RES/80/142", "title": "Test Resolution"},
@@ -253,16 +239,9 @@ class TestLinkDocumentsWithUndl:
         assert "A/C.2/80/L.35/Rev.1" in resolution["linked_proposal_symbols"]
         assert proposal["linked_resolution_symbol"] == "A/RES/80/142"
 
-    def test_link_fallback_to_symbol_reference(self, mocker, mock_session):
+    def test_link_fallback_to_symbol_reference(self, undl_ok):
         """Fall back to symbol reference when UNDL has no draft."""
-        mock_response = mocker.Mock()
-        mock_response.status_code = 200
-        mock_response.text = SAMPLE_MARC_XML_NO_DRAFT
-        mock_response.raise_for_status = mocker.Mock()
-
-        mock_session.get.return_value = mock_response
-        mocker.patch("mandate_pipeline.linking.time.sleep")
-        mocker.patch("mandate_pipeline.linking._save_cached_metadata")
+        undl_ok(SAMPLE_MARC_XML_NO_DRAFT)
 
         documents = [
             {
@@ -412,6 +391,10 @@ class TestNormalizeSymbol:
         """Already normalized symbol unchanged."""
         assert normalize_symbol("A/80/L.1") == "A/80/L.1"
 
+    def test_result_is_interned(self):
+        """Equal normalized symbols share one string object."""
+        assert normalize_symbol(" a/80/l.1") is normalize_symbol("A/80/L.1 ")
+
 
 class TestNormalizeTitle:
     """Test title normalization for fuzzy matching."""
@@ -443,6 +426,62 @@ class TestNormalizeTitle:
         assert normalize_title("") == ""
 
 
+class TestTitleSimilarity:
+    """Test the fallback fuzzy title scorers."""
+
+    TITLE_PAIRS = [
+        ("climate action", "climate action"),
+        ("climate action", "climate action plan"),
+        ("humanitarian assistance", "strengthening humanitarian assistance"),
+        ("short", "completely different and much longer title"),
+        ("", "climate action"),
+    ]
+
+    def test_indel_ratio_matches_rapidfuzz(self):
+        """Pure-Python scorer agrees with rapidfuzz.fuzz.ratio."""
+        fuzz = pytest.importorskip("rapidfuzz.fuzz")
+
+        for a, b in self.TITLE_PAIRS:
+            assert _indel_ratio(a, b) == pytest.approx(fuzz.ratio(a, b))
+
+    def test_pair_scores_without_numpy(self, monkeypatch):
+        """RapidFuzz scores pair by pair when NumPy is not installed."""
+        pytest.importorskip("rapidfuzz")
+        monkeypatch.setattr("mandate_pipeline.linking._HAS_NUMPY", False)
+
+        queries = [a for a, _ in self.TITLE_PAIRS]
+        titles = [b for _, b in self.TITLE_PAIRS]
+        scores = _title_pair_scores(queries, titles)
+        expected = [_indel_ratio(a, b) for a, b in self.TITLE_PAIRS]
+        assert list(scores) == pytest.approx(expected)
+
+    def test_numba_kernel_matches_pure_python(self):
+        """Numba kernel agrees with the pure-Python scorer."""
+        linking_numba = pytest.importorskip("mandate_pipeline.linking_numba")
+
+        queries = [a for a, _ in self.TITLE_PAIRS]
+        titles = [b for _, b in self.TITLE_PAIRS]
+        scores = linking_numba.score_pairs(queries, titles)
+        expected = [_indel_ratio(a, b) for a, b in self.TITLE_PAIRS]
+        assert scores.tolist() == pytest.approx(expected, abs=1e-3)
+
+    def test_linking_import_does_not_load_numba(self):
+        """Importing linking leaves Numba unloaded until the fallback needs it."""
+        import subprocess
+        import sys
+
+        code = "import sys, mandate_pipeline.linking; print('numba' in sys.modules)"
+        src_dir = str(Path(__file__).resolve().parent.parent / "src")
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={"PYTHONPATH": src_dir},
+        )
+        assert result.stdout.strip() == "False"
+
+
 class TestIsResolution:
     """Test resolution symbol detection."""
 
@@ -598,6 +637,22 @@ class TestLinkDocuments:
         assert "A/80/L.1" in resolution["linked_proposal_symbols"]
         assert "A/80/L.5" in resolution["linked_proposal_symbols"]
 
+    def test_duplicate_references_linked_once(self):
+        """Repeated symbol references produce a single link, in order."""
+        documents = [
+            {
+                "symbol": "A/RES/80/1",
+                "title": "Climate Action",
+                "symbol_references": ["A/80/L.5", "A/80/L.1", "A/80/L.5"],
+            },
+            {"symbol": "A/80/L.1", "title": "Climate Action"},
+            {"symbol": "A/80/L.5", "title": "Related Topic"},
+        ]
+
+        link_documents(documents, use_undl_metadata=False)
+
+        assert documents[0]["linked_proposal_symbols"] == ["A/80/L.5", "A/80/L.1"]
+
     def test_link_by_fuzzy_title_match(self):
         """Link by fuzzy title matching when no symbol reference."""
         documents = [
@@ -668,6 +723,23 @@ class TestLinkDocuments:
         resolution = documents[0]
         assert resolution["linked_proposal_symbols"] == ["A/80/L.1"]
 
+    def test_fuzzy_candidates_blocked_by_agenda(self):
+        """Only proposals sharing an agenda item (or with none) are scored."""
+        documents = [
+            {"symbol": "A/RES/80/1", "title": "Climate Action", "agenda_items": ["Item 68"]},
+            {"symbol": "A/80/L.1", "title": "Climate Action", "agenda_items": ["Item 68", "Item 70"]},
+            {"symbol": "A/80/L.2", "title": "Climate Action", "agenda_items": ["Item 125"]},
+            {"symbol": "A/80/L.3", "title": "Climate Action Plan", "agenda_items": []},
+        ]
+
+        link_documents(documents, use_undl_metadata=False)
+
+        fuzzy_audit = get_linking_audit()["A/RES/80/1"]["pass2_fuzzy"]
+        scored = [c["symbol"] for c in fuzzy_audit["candidates"]]
+        assert scored == ["A/80/L.1", "A/80/L.3"]
+        assert fuzzy_audit["best_match"] == "A/80/L.1"
+        assert fuzzy_audit["agenda_overlap"] is True
+
     def test_fuzzy_link_threshold(self):
         """Fuzzy match requires 85% similarity threshold."""
         documents = [
@@ -766,6 +838,37 @@ class TestLinkDocuments:
         link_documents(documents, use_undl_metadata=False)  # Should not raise
         assert documents == []
 
+    def test_proposal_only_documents_skip_linking(self, mocker):
+        """Proposal-only batches get default fields without any lookups."""
+        mock_get_session = mocker.patch("mandate_pipeline.linking._get_session")
+        documents = [
+            {"symbol": "A/80/L.1", "title": "Climate Action", "symbol_references": []},
+            {"symbol": "A/80/L.2", "title": "Climate Action", "symbol_references": []},
+        ]
+
+        link_documents(documents, use_undl_metadata=True)
+
+        mock_get_session.assert_not_called()
+        for doc in documents:
+            assert doc["linked_resolution_symbol"] is None
+            assert doc["linked_proposal_symbols"] == []
+
+    def test_offline_linking_skips_undl(self, mocker, undl_cache_dir):
+        """use_undl_metadata=False never opens a session or the UNDL cache."""
+        mock_get_session = mocker.patch("mandate_pipeline.linking._get_session")
+        mock_cache_index = mocker.patch("mandate_pipeline.linking._load_cache_index")
+        documents = [
+            {"symbol": "A/RES/80/1", "title": "Climate Action", "symbol_references": ["A/80/L.1"]},
+            {"symbol": "A/80/L.1", "title": "Climate Action", "symbol_references": []},
+        ]
+
+        link_documents(documents, use_undl_metadata=False)
+
+        mock_get_session.assert_not_called()
+        mock_cache_index.assert_not_called()
+        assert not undl_cache_dir.exists()
+        assert documents[0]["linked_proposal_symbols"] == ["A/80/L.1"]
+
     def test_proposal_already_linked_not_relinked(self):
         """Proposals already linked to a resolution are skipped in fuzzy matching."""
         documents = [
@@ -940,6 +1043,18 @@ class TestAnnotateLinkage:
         linked = resolution["linked_proposals"][0]
         assert linked["filename"] == "A_80_L.1.html"
 
+    def test_linked_proposal_entries_shared(self):
+        """Resolutions linking the same proposal share one entry."""
+        documents = [
+            {"symbol": "A/RES/80/1", "doc_type": "resolution", "linked_proposal_symbols": ["A/80/L.1"]},
+            {"symbol": "A/RES/80/2", "doc_type": "resolution", "linked_proposal_symbols": ["A/80/L.1"]},
+            {"symbol": "A/80/L.1", "doc_type": "proposal"},
+        ]
+
+        annotate_linkage(documents)
+
+        assert documents[0]["linked_proposals"][0] is documents[1]["linked_proposals"][0]
+
     def test_empty_documents_list(self):
         """Empty documents list handled gracefully."""
         documents = []
@@ -1050,17 +1165,16 @@ class TestDataQualityLinkage:
             ("Short", "Completely Different and Much Longer Title", False),
         ]
 
-        for title1, title2, should_match in test_cases:
-            norm1 = normalize_title(title1)
-            norm2 = normalize_title(title2)
-
-            from rapidfuzz import fuzz
-            similarity = fuzz.ratio(norm1, norm2)
+        # Score every pair in one batched call, as Pass 2 does
+        titles1 = [normalize_title(title1) for title1, _, _ in test_cases]
+        titles2 = [normalize_title(title2) for _, title2, _ in test_cases]
+        similarities = _title_pair_scores(titles1, titles2)
 
+        for (title1, title2, should_match), similarity in zip(test_cases, similarities):
             if should_match:
-                assert similarity >= 85, f"Expected match: {title1} vs {title2}"
+                assert similarity >= FUZZY_MATCH_THRESHOLD, f"Expected match: {title1} vs {title2}"
             else:
-                assert similarity < 85, f"Expected no match: {title1} vs {title2}"
+                assert similarity < FUZZY_MATCH_THRESHOLD, f"Expected no match: {title1} vs {title2}"
 
 
 # =============================================================================
@@ -1127,31 +1241,32 @@ class TestLinkageIntegration:
         # Run linking
         link_documents(documents, use_undl_metadata=False)
         annotate_linkage(documents)
+        by_sym = {d["symbol"]: d for d in documents}
 
         # Verify RES/80/1 has linked_proposals
-        res1 = next(d for d in documents if d["symbol"] == "A/RES/80/1")
+        res1 = by_sym["A/RES/80/1"]
         assert len(res1["linked_proposals"]) == 1
         assert res1["linked_proposals"][0]["symbol"] == "A/80/L.1"
 
         # Verify RES/80/2 has linked_proposals
-        res2 = next(d for d in documents if d["symbol"] == "A/RES/80/2")
+        res2 = by_sym["A/RES/80/2"]
         assert len(res2["linked_proposals"]) == 1
         assert res2["linked_proposals"][0]["symbol"] == "A/80/L.5"
 
         # Verify L.1 is adopted
-        l1 = next(d for d in documents if d["symbol"] == "A/80/L.1")
+        l1 = by_sym["A/80/L.1"]
         assert l1["is_adopted_draft"] is True
         assert l1["adopted_by"] == "A/RES/80/1"
 
         # Verify L.5 is adopted
-        l5 = next(d for d in documents if d["symbol"] == "A/80/L.5")
+        l5 = by_sym["A/80/L.5"]
         assert l5["is_adopted_draft"] is True
         assert l5["adopted_by"] == "A/RES/80/2"
 
         # Verify revision is NOT marked as adopted base
-        rev = next(d for d in documents if d["symbol"] == "A/80/L.1/Rev.1")
+        rev = by_sym["A/80/L.1/Rev.1"]
         assert rev["is_adopted_draft"] is False
 
         # Verify unrelated proposal is not adopted
-        l10 = next(d for d in documents if d["symbol"] == "A/80/L.10")
+        l10 = by_sym["A/80/L.10"]
         assert l10["is_adopted_draft"] is False
@@ -3,22 +3,64 @@
 
 import json
 import pytest
+from collections import Counter
+from operator import methodcaller
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
-import tempfile
 import shutil
 
+from mandate_pipeline import config, detection, discovery, extractor, generation, linking
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_linked_document(linked_file: Path) -> dict:
+    """Parse a linked document, with orjson when available."""
+    # One binary read; both parsers decode UTF-8 bytes themselves
+    data = linked_file.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def validate_linked_file(linked_file: Path) -> list[str]:
+    """Return structure errors for one linked document."""
+    errors = []
+    try:
+        doc = load_linked_document(linked_file)
+    except json.JSONDecodeError as e:
+        return [f"{linked_file.name}: invalid JSON - {e}"]
+
+    # Required fields
+    if "symbol" not in doc:
+        errors.append(f"{linked_file.name}: missing 'symbol'")
+
+    # Type checks
+    signals = doc.get("signals")
+    if signals is not None and not isinstance(signals, dict):
+        errors.append(f"{linked_file.name}: 'signals' should be dict, got {type(signals).__name__}")
+
+    signal_summary = doc.get("signal_summary")
+    if signal_summary is not None and not isinstance(signal_summary, dict):
+        errors.append(f"{linked_file.name}: 'signal_summary' should be dict")
+
+    # signal_paragraphs should be list if present
+    signal_paragraphs = doc.get("signal_paragraphs")
+    if signal_paragraphs is not None and not isinstance(signal_paragraphs, list):
+        errors.append(f"{linked_file.name}: 'signal_paragraphs' should be list")
+
+    return errors
+
 
 class TestDiscoveryWorkflow:
     """End-to-end tests for the Discover workflow."""
 
     def test_load_patterns(self):
         """Test loading discovery patterns from config."""
-        from mandate_pipeline.discovery import load_patterns
-
         patterns_file = Path("config/patterns.yaml")
         if patterns_file.exists():
-            patterns = load_patterns(patterns_file)
+            patterns = discovery.load_patterns(patterns_file)
             assert isinstance(patterns, list)
             assert len(patterns) > 0
             # Each pattern should have required fields
@@ -27,13 +69,11 @@ class TestDiscoveryWorkflow:
 
     def test_pattern_structure(self):
         """Validate pattern configuration structure."""
-        from mandate_pipeline.discovery import load_patterns
-
         patterns_file = Path("config/patterns.yaml")
         if not patterns_file.exists():
             pytest.skip("patterns.yaml not found")
 
-        patterns = load_patterns(patterns_file)
+        patterns = discovery.load_patterns(patterns_file)
         for pattern in patterns:
             # Patterns should have a name and search criteria
             assert isinstance(pattern, dict)
@@ -44,24 +84,16 @@ class TestExtractionWorkflow:
 
     def test_extract_functions_exist(self):
         """Verify all extraction functions are importable."""
-        from mandate_pipeline.extractor import (
-            extract_text,
-            extract_operative_paragraphs,
-            extract_lettered_paragraphs,
-            extract_title,
-            extract_agenda_items,
-            find_symbol_references,
-        )
-
         # All functions should be callable
-        assert callable(extract_text)
-        assert callable(extract_operative_paragraphs)
-        assert callable(extract_title)
+        assert callable(extractor.extract_text)
+        assert callable(extractor.extract_operative_paragraphs)
+        assert callable(extractor.extract_lettered_paragraphs)
+        assert callable(extractor.extract_title)
+        assert callable(extractor.extract_agenda_items)
+        assert callable(extractor.find_symbol_references)
 
     def test_extract_operative_paragraphs(self):
         """Test operative paragraph extraction."""
-        from mandate_pipeline.extractor import extract_operative_paragraphs
-
         sample_text = """
         The General Assembly,
 
@@ -74,7 +106,7 @@ class TestExtractionWorkflow:
         3. Takes note of the report of the Secretary-General;
         """
 
-        paragraphs = extract_operative_paragraphs(sample_text)
+        paragraphs = extractor.extract_operative_paragraphs(sample_text)
         assert isinstance(paragraphs, dict)
         # Should extract numbered paragraphs
         if paragraphs:
@@ -84,14 +116,12 @@ class TestExtractionWorkflow:
 
     def test_find_symbol_references(self):
         """Test finding UN document symbol references."""
-        from mandate_pipeline.extractor import find_symbol_references
-
         sample_text = """
         Recalling resolution A/RES/70/1 and A/RES/75/280,
         and taking note of A/80/L.1 and its amendment A/80/L.1/Rev.1
         """
 
-        refs = find_symbol_references(sample_text)
+        refs = extractor.find_symbol_references(sample_text)
         assert isinstance(refs, list)
         # Should find resolution symbols
         if refs:
@@ -124,11 +154,9 @@ class TestDetectionWorkflow:
 
     def test_load_checks(self):
         """Test loading signal detection checks."""
-        from mandate_pipeline.detection import load_checks
-
         checks_file = Path("config/checks.yaml")
         if checks_file.exists():
-            checks = load_checks(checks_file)
+            checks = detection.load_checks(checks_file)
             assert isinstance(checks, list)
             assert len(checks) > 0
             # Each check should have required fields (signal or name)
@@ -136,15 +164,55 @@ class TestDetectionWorkflow:
                 assert "signal" in check or "name" in check
                 assert "phrases" in check
 
+    def test_load_checks_cached_until_file_changes(self, tmp_path):
+        """Test that checks are parsed once and reloaded when the file changes."""
+        import os
+        import yaml
+
+        checks_file = tmp_path / "checks.yaml"
+        checks_file.write_text("checks:\n  - signal: report\n    phrases: [report]\n")
+
+        with patch("mandate_pipeline.config.yaml.safe_load", wraps=yaml.safe_load) as safe_load:
+            checks = detection.load_checks(checks_file)
+            checks[0]["signal"] = "mutated"
+            assert detection.load_checks(checks_file)[0]["signal"] == "report"
+            assert safe_load.call_count == 1
+
+            checks_file.write_text("checks:\n  - signal: agenda\n    phrases: [agenda]\n")
+            stat = checks_file.stat()
+            os.utime(checks_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert detection.load_checks(checks_file)[0]["signal"] == "agenda"
+            assert safe_load.call_count == 2
+
+    def test_load_checks_reads_json_sidecar(self, tmp_path):
+        """Test that a fresh process reuses the JSON sidecar instead of YAML."""
+        checks_file = tmp_path / "checks.yaml"
+        checks_file.write_text("checks:\n  - signal: report\n    phrases: [report]\n")
+        expected = detection.load_checks(checks_file)
+        assert (tmp_path / "checks.yaml.cache.json").exists()
+
+        with patch.dict(config._CONFIG_CACHE, clear=True), \
+                patch("mandate_pipeline.config.yaml.safe_load") as safe_load:
+            assert detection.load_checks(checks_file) == expected
+            safe_load.assert_not_called()
+
+    @pytest.mark.parametrize("sidecar", ["null", "[]", '"checks"'])
+    def test_load_checks_ignores_malformed_sidecar(self, tmp_path, sidecar):
+        """Test that a sidecar holding valid JSON but no object falls back to YAML."""
+        checks_file = tmp_path / "checks.yaml"
+        checks_file.write_text("checks:\n  - signal: report\n    phrases: [report]\n")
+        (tmp_path / "checks.yaml.cache.json").write_text(sidecar)
+
+        with patch.dict(config._CONFIG_CACHE, clear=True):
+            assert detection.load_checks(checks_file) == [{"signal": "report", "phrases": ["report"]}]
+
     def test_run_checks(self):
         """Test running signal detection on paragraphs."""
-        from mandate_pipeline.detection import load_checks, run_checks
-
         checks_file = Path("config/checks.yaml")
         if not checks_file.exists():
             pytest.skip("checks.yaml not found")
 
-        checks = load_checks(checks_file)
+        checks = detection.load_checks(checks_file)
 
         # Sample paragraphs with likely signals
         test_paragraphs = {
@@ -153,7 +221,7 @@ class TestDetectionWorkflow:
             3: "Requests the President of the General Assembly to convene a meeting.",
         }
 
-        signals = run_checks(test_paragraphs, checks)
+        signals = detection.run_checks(test_paragraphs, checks)
         assert isinstance(signals, dict)
 
         # Verify signal structure
@@ -162,6 +230,81 @@ class TestDetectionWorkflow:
             for signal in para_signals:
                 assert isinstance(signal, str)
 
+    def test_run_checks_backends_agree(self):
+        """Test that the Hyperscan scan matches the substring fallback."""
+        if detection.hyperscan is None:
+            pytest.skip("hyperscan not installed")
+
+        checks = [
+            {"signal": "report", "phrases": ["Submit a report", "report"]},
+            {"signal": "agenda", "phrases": ["provisional agenda"]},
+            {"signal": "dialogue", "phrases": ["Diálogo (de alto nivel)"]},
+            {"signal": "report", "phrases": ["a report on"]},
+            {"signal": "none", "phrases": []},
+        ]
+        paragraphs = {
+            1: "Requests the Secretary-General to SUBMIT A REPORT on implementation.",
+            2: "Decides to include in the provisional agenda of its eightieth session.",
+            3: "Convoca un diálogo (de alto nivel) sobre el tema.",
+            4: "Takes note with appreciation.",
+            5: "",
+        }
+
+        fast = detection.run_checks(paragraphs, checks)
+        with patch.object(detection, "hyperscan", None):
+            slow = detection.run_checks(paragraphs, checks)
+
+        assert fast == slow
+        assert fast[1] == ["report", "report"]
+
+    def test_run_checks_thread_safe(self):
+        """Test that run_checks can be called from many threads at once."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        checks = [
+            {"signal": "report", "phrases": ["report"]},
+            {"signal": "agenda", "phrases": ["provisional agenda"]},
+        ]
+        paragraphs = {
+            n: f"Paragraph {n} requests a report for the provisional agenda." for n in range(1, 51)
+        }
+        expected = detection.run_checks(paragraphs, checks)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: detection.run_checks(paragraphs, checks), range(200)))
+
+        assert all(result == expected for result in results)
+
+    def test_run_checks_keeps_paragraph_order(self):
+        """Test that signals come back in paragraph order, so consumers need not sort."""
+        checks = [{"signal": "report", "phrases": ["report"]}]
+        paragraphs = {n: f"Paragraph {n} requests a report." for n in (1, 2, 9, 10, 11)}
+
+        signals = detection.run_checks(paragraphs, checks)
+
+        assert list(signals) == [1, 2, 9, 10, 11]
+
+    def test_run_checks_interns_signals(self):
+        """Test that every matched signal name is one shared string."""
+        checks = [{"signal": "".join(["rep", "ort"]), "phrases": ["report"]}]
+        paragraphs = {1: "Requests a report.", 2: "Also a report."}
+
+        first = detection.run_checks(paragraphs, checks)
+        second = detection.run_checks(paragraphs, [{"signal": "".join(["re", "port"]), "phrases": ["report"]}])
+
+        assert first[1][0] is first[2][0] is second[1][0]
+
+    def test_run_checks_non_string_signals(self):
+        """Test that non-str signal names from YAML pass through unchanged."""
+        checks = [
+            {"signal": 2030, "phrases": ["agenda"]},
+            {"signal": True, "phrases": ["report"]},
+            {"signal": None, "phrases": ["session"]},
+        ]
+        paragraphs = {1: "Requests a report for the agenda of the next session."}
+
+        assert detection.run_checks(paragraphs, checks) == {1: [2030, True, None]}
+
     def test_detection_output_format(self):
         """Test detection output has correct structure."""
         # Simulate detection result format
@@ -192,16 +335,14 @@ class TestLinkingWorkflow:
 
     def test_derive_resolution_origin(self):
         """Test deriving resolution origin from symbol."""
-        from mandate_pipeline.linking import derive_resolution_origin
-
         # Test Plenary resolution
         doc = {"symbol": "A/RES/79/1", "linked_proposal_symbols": []}
-        origin = derive_resolution_origin(doc)
+        origin = linking.derive_resolution_origin(doc)
         assert isinstance(origin, str)
 
         # Test committee resolution (C.1)
         doc = {"symbol": "A/RES/79/100", "linked_proposal_symbols": ["A/C.1/79/L.1"]}
-        origin = derive_resolution_origin(doc)
+        origin = linking.derive_resolution_origin(doc)
         assert isinstance(origin, str)
 
     def test_linking_output_format(self):
@@ -229,36 +370,12 @@ class TestLinkingWorkflow:
         assert isinstance(linked_doc["linked_proposals"], list)
         assert isinstance(linked_doc["linked_resolutions"], list)
 
-    def test_load_linked_documents(self):
-        """Test loading linked documents from data directory."""
-        linked_dir = Path("data/linked")
-        if not linked_dir.exists():
-            pytest.skip("data/linked not found")
-
-        # Load a sample of documents
-        errors = []
-        for linked_file in list(linked_dir.glob("*.json"))[:10]:
-            if linked_file.name == "index.json":
-                continue
-
-            try:
-                with open(linked_file) as f:
-                    doc = json.load(f)
+    def test_load_linked_documents(self, linked_file):
+        """Test loading each linked document from the data directory."""
+        doc = load_linked_document(linked_file)
 
-                # Validate required fields
-                assert "symbol" in doc, f"Missing symbol in {linked_file}"
-                assert "signals" in doc, f"Missing signals in {linked_file}"
-
-                # Validate types
-                if not isinstance(doc["signals"], dict):
-                    errors.append(f"{linked_file}: signals should be dict")
-                if "signal_summary" in doc and not isinstance(doc["signal_summary"], dict):
-                    errors.append(f"{linked_file}: signal_summary should be dict")
-
-            except Exception as e:
-                errors.append(f"{linked_file}: {e}")
-
-        assert len(errors) == 0, f"Document validation errors:\n" + "\n".join(errors)
+        assert "symbol" in doc, f"Missing symbol in {linked_file}"
+        assert "signals" in doc, f"Missing signals in {linked_file}"
 
 
 class TestGenerationWorkflow:
@@ -266,21 +383,17 @@ class TestGenerationWorkflow:
 
     def test_safe_paragraph_number(self):
         """Test the safe paragraph number helper."""
-        from mandate_pipeline.generation import safe_paragraph_number
-
         # Valid cases
-        assert safe_paragraph_number({"number": "42"}) == 42
-        assert safe_paragraph_number({"number": 7}) == 7
+        assert generation.safe_paragraph_number({"number": "42"}) == 42
+        assert generation.safe_paragraph_number({"number": 7}) == 7
 
         # Edge cases
-        assert safe_paragraph_number({}) == 0
-        assert safe_paragraph_number({"number": None}) == 0
-        assert safe_paragraph_number({"number": "invalid"}) == 0
+        assert generation.safe_paragraph_number({}) == 0
+        assert generation.safe_paragraph_number({"number": None}) == 0
+        assert generation.safe_paragraph_number({"number": "invalid"}) == 0
 
     def test_signal_paragraphs_enrichment(self):
         """Test creating signal_paragraphs from signals dict."""
-        from mandate_pipeline.generation import safe_paragraph_number
-
         # Input document (from linked/*.json)
         doc = {
             "symbol": "A/RES/79/1",
@@ -305,7 +418,7 @@ class TestGenerationWorkflow:
                     "signals": para_signals,
                 })
 
-        signal_paras.sort(key=safe_paragraph_number)
+        signal_paras.sort(key=generation.safe_paragraph_number)
 
         # Validate result
         assert isinstance(signal_paras, list)
@@ -347,14 +460,13 @@ class TestGenerationWorkflow:
         assert len(docs_with_actual_signals) == 2
 
         # Count total paragraphs (using correct list default)
-        total_paras = sum(len(d.get("signal_paragraphs", [])) for d in documents)
+        total_paras = sum(map(len, map(methodcaller("get", "signal_paragraphs", []), documents)))
         assert total_paras == 3
 
         # Count total signals from summaries
-        signal_counts = {}
+        signal_counts = Counter()
         for doc in documents:
-            for signal, count in doc.get("signal_summary", {}).items():
-                signal_counts[signal] = signal_counts.get(signal, 0) + count
+            signal_counts.update(doc.get("signal_summary", {}))
 
         assert signal_counts == {"report": 2, "agenda": 1}
 
@@ -408,8 +520,6 @@ class TestFullPipelineIntegration:
         }
 
         # Detection reads paragraphs
-        from mandate_pipeline.detection import run_checks
-
         # run_checks expects dict[int, str]
         # After JSON round-trip, keys become strings
         paragraphs_after_json = {str(k): v for k, v in extracted["paragraphs"].items()}
@@ -417,7 +527,7 @@ class TestFullPipelineIntegration:
         # Detection should still work with string keys
         # (checks.yaml may not exist in test env)
         checks = []  # Empty checks for test
-        signals = run_checks(paragraphs_after_json, checks)
+        signals = detection.run_checks(paragraphs_after_json, checks)
         assert isinstance(signals, dict)
 
     def test_data_flow_detection_to_linking(self):
@@ -438,19 +548,15 @@ class TestFullPipelineIntegration:
             "linked_resolutions": [],
         }
 
-        # After JSON serialization (simulating file write/read)
-        linked_json = json.dumps(linked)
-        linked_loaded = json.loads(linked_json)
+        # After JSON serialization (simulating file write/read), keys are strings
+        linked_loaded = {**linked, "signals": {str(k): v for k, v in linked["signals"].items()}}
 
-        # Signals keys become strings
         assert isinstance(linked_loaded["signals"], dict)
         for key in linked_loaded["signals"]:
             assert isinstance(key, str)
 
     def test_data_flow_linking_to_generation(self):
         """Test data compatibility between linking and generation."""
-        from mandate_pipeline.generation import safe_paragraph_number
-
         # Linked document (as loaded from JSON)
         linked = {
             "symbol": "A/RES/79/1",
@@ -470,7 +576,7 @@ class TestFullPipelineIntegration:
                 })
 
         # Sort should work with string numbers
-        signal_paras.sort(key=safe_paragraph_number)
+        signal_paras.sort(key=generation.safe_paragraph_number)
 
         # Verify correct order (5 before 10)
         assert signal_paras[0]["number"] == "5"
@@ -492,38 +598,27 @@ class TestErrorHandling:
 
     def test_missing_file_handling(self):
         """Test graceful handling of missing files."""
-        from mandate_pipeline.extractor import extract_text
-
         with pytest.raises(FileNotFoundError):
-            extract_text(Path("/nonexistent/file.pdf"))
+            extractor.extract_text(Path("/nonexistent/file.pdf"))
 
-    def test_invalid_json_handling(self):
+    def test_invalid_json_handling(self, tmp_path):
         """Test handling of invalid JSON in data files."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("{ invalid json }")
-            temp_path = f.name
+        invalid_file = tmp_path / "invalid.json"
+        invalid_file.write_bytes(b"{ invalid json }")
 
-        try:
-            with pytest.raises(json.JSONDecodeError):
-                with open(temp_path) as f:
-                    json.load(f)
-        finally:
-            Path(temp_path).unlink()
+        with pytest.raises(json.JSONDecodeError):
+            json.loads(invalid_file.read_bytes())
 
     def test_empty_paragraphs_handling(self):
         """Test handling documents with no paragraphs."""
-        from mandate_pipeline.detection import run_checks
-
         empty_paragraphs = {}
         checks = []  # Empty checks
 
-        signals = run_checks(empty_paragraphs, checks)
+        signals = detection.run_checks(empty_paragraphs, checks)
         assert signals == {}
 
     def test_malformed_signals_handling(self):
         """Test handling documents with unusual signal data."""
-        from mandate_pipeline.generation import safe_paragraph_number
-
         # Document with various edge cases
         docs_to_test = [
             {"signals": {}, "signal_summary": {}},  # Empty
@@ -540,60 +635,38 @@ class TestErrorHandling:
                     if para_signals:
                         signal_paras.append({"number": para_num, "signals": para_signals})
                 # Sort should work
-                signal_paras.sort(key=safe_paragraph_number)
+                signal_paras.sort(key=generation.safe_paragraph_number)
 
 
 class TestDataValidation:
     """Tests validating actual data in the repository."""
 
-    def test_all_linked_documents_valid(self):
-        """Validate all linked documents have correct structure."""
-        linked_dir = Path("data/linked")
-        if not linked_dir.exists():
-            pytest.skip("data/linked not found")
-
-        errors = []
-        for linked_file in linked_dir.glob("*.json"):
-            if linked_file.name == "index.json":
-                continue
-
-            try:
-                with open(linked_file) as f:
-                    doc = json.load(f)
-
-                # Required fields
-                if "symbol" not in doc:
-                    errors.append(f"{linked_file.name}: missing 'symbol'")
-
-                # Type checks
-                signals = doc.get("signals")
-                if signals is not None and not isinstance(signals, dict):
-                    errors.append(f"{linked_file.name}: 'signals' should be dict, got {type(signals).__name__}")
-
-                signal_summary = doc.get("signal_summary")
-                if signal_summary is not None and not isinstance(signal_summary, dict):
-                    errors.append(f"{linked_file.name}: 'signal_summary' should be dict")
-
-                # signal_paragraphs should be list if present
-                signal_paragraphs = doc.get("signal_paragraphs")
-                if signal_paragraphs is not None and not isinstance(signal_paragraphs, list):
-                    errors.append(f"{linked_file.name}: 'signal_paragraphs' should be list")
-
-            except json.JSONDecodeError as e:
-                errors.append(f"{linked_file.name}: invalid JSON - {e}")
+    def test_all_linked_documents_valid(self, linked_file):
+        """Validate each linked document has correct structure."""
+        errors = validate_linked_file(linked_file)
+        assert not errors, "\n".join(errors)
+
+    def test_invalid_linked_documents_reported(self, tmp_path):
+        """Test that broken and truncated linked documents fail validation."""
+        broken_file = tmp_path / "broken.json"
+        broken_file.write_text('{"symbol": "A/RES/80/2", "signals": {')
+        # Truncated after every checked field
+        truncated_file = tmp_path / "truncated.json"
+        truncated_file.write_text(
+            '{"symbol": "A/RES/80/3", "signals": {}, "signal_summary": {}, '
+            '"signal_paragraphs": [], "paragraphs": {"1": "x'
+        )
 
-        if errors:
-            pytest.fail(f"Found {len(errors)} validation errors:\n" + "\n".join(errors[:20]))
+        assert validate_linked_file(broken_file)
+        assert validate_linked_file(truncated_file)
 
     def test_checks_config_valid(self):
         """Validate checks configuration."""
-        from mandate_pipeline.detection import load_checks
-
         checks_file = Path("config/checks.yaml")
         if not checks_file.exists():
             pytest.skip("checks.yaml not found")
 
-        checks = load_checks(checks_file)
+        checks = detection.load_checks(checks_file)
         assert len(checks) > 0, "No checks defined"
 
         for check in checks:
@@ -604,11 +677,9 @@ class TestDataValidation:
 
     def test_patterns_config_valid(self):
         """Validate patterns configuration."""
-        from mandate_pipeline.discovery import load_patterns
-
         patterns_file = Path("config/patterns.yaml")
         if not patterns_file.exists():
             pytest.skip("patterns.yaml not found")
 
-        patterns = load_patterns(patterns_file)
+        patterns = discovery.load_patterns(patterns_file)
         assert len(patterns) > 0, "No patterns defined"